@@ -19,12 +19,18 @@ API 層の責務:
 
 from __future__ import annotations
 
-from typing import Optional
-
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
-
-from backend.app.deps import get_workflow
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from backend.app.deps import get_workflow, get_workflow_executor
 from backend.core.workflow import Workflow
 from backend.domain.workspace_index import WorkspaceIndex
 from backend.domain.snapshot import Snapshot
@@ -44,6 +50,9 @@ logger = get_logger(__name__)
 router = APIRouter(
     prefix="/chat",
     tags=["chat"],
+    # Diff は大きくなりやすいため、orjson による
+    # 高速シリアライズをデフォルトとする
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -81,6 +90,11 @@ class ChatFromWorkspaceRequest(BaseModel):
         description="既存 Diff（再生成・修正用）",
     )
 
+    model_config = {
+        # 想定外フィールドの混入を禁止（domain 層と同一方針）
+        "extra": "forbid",
+    }
+
 
 class ChatFromSnapshotRequest(BaseModel):
     """
@@ -110,6 +124,11 @@ class ChatFromSnapshotRequest(BaseModel):
         description="既存 Diff（再生成・修正用）",
     )
 
+    model_config = {
+        # 想定外フィールドの混入を禁止（domain 層と同一方針）
+        "extra": "forbid",
+    }
+
 
 class ChatResponse(BaseModel):
     """
@@ -118,23 +137,107 @@ class ChatResponse(BaseModel):
     注意:
     - Diff は「変更提案そのもの」
     - API 層では解釈しない
+    - OpenAPI スキーマ定義用（レスポンス再検証には使わない）
     """
 
     diff: Diff
 
 
+# ============================================================
+# リクエスト・パース
+# ============================================================
+#
+# Chat リクエストは WorkspaceIndex / Snapshot 全体を含む
+# 最重量ボディのため、FastAPI の
+# 「json.loads → dict 走査 → モデル検証」の二段構えを避け、
+# 生バイト列から pydantic-core（Rust 実装）で一段構築する。
+#
+# 注意:
+# - 検証内容そのものは従来と同一（モデル定義が唯一の正）
+# - 失敗時は FastAPI 標準と同じ 422 を返す
+# - TypeAdapter はモジュールレベルで一度だけ構築し、
+#   リクエストごとのスキーマ解決を避ける
+#
+_WORKSPACE_REQUEST_ADAPTER = TypeAdapter(ChatFromWorkspaceRequest)
+_SNAPSHOT_REQUEST_ADAPTER = TypeAdapter(ChatFromSnapshotRequest)
+
+
+async def _parse_body(
+    request: Request,
+    adapter: TypeAdapter,
+) -> BaseModel:
+    """
+    リクエストボディを指定アダプタで一段パースする。
+    """
+    body = await request.body()
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=e.errors(include_url=False),
+        ) from e
+
+
+# ============================================================
+# レスポンス・ストリーミング
+# ============================================================
+def _iter_diff_response(diff: Diff) -> Iterator[bytes]:
+    """
+    ChatResponse 互換 JSON をファイル単位で逐次生成する。
+
+    目的:
+    - 巨大な Diff を一括シリアライズせず、
+      メモリ使用量を一定に保つ
+    - 最初のファイルが出来た時点でレスポンスを流し始める
+
+    注意:
+    - 出力構造は {"diff": {...}} のまま変えない
+    - Diff の中身を解釈・加工しない
+    """
+
+    yield b'{"diff":{"project_id":'
+    yield orjson.dumps(diff.project_id)
+    yield b',"files":['
+
+    for i, diff_file in enumerate(diff.files):
+        if i:
+            yield b","
+        yield orjson.dumps(diff_file.model_dump(mode="json"))
+
+    yield b'],"raw_response":'
+    yield orjson.dumps(diff.raw_response)
+    yield b"}}"
+
+
 # ============================================================
 # Endpoint: Workspace 起点
 # ============================================================
 @router.post(
     "",
-    response_model=ChatResponse,
+    # response_model を指定すると生成済み Diff が
+    # もう一度 Pydantic 検証を通ってしまうため、
+    # OpenAPI 定義は responses で与え、検証はスキップする
+    responses={200: {"model": ChatResponse}},
     summary="Chat from WorkspaceIndex",
+    # ボディは _parse_body で手動パースするため、
+    # OpenAPI スキーマはここで明示する
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": ChatFromWorkspaceRequest.model_json_schema(),
+                },
+            },
+        },
+    },
 )
-def chat_from_workspace(
-    request: ChatFromWorkspaceRequest,
+async def chat_from_workspace(
+    raw_request: Request,
     workflow: Workflow = Depends(get_workflow),
-) -> ChatResponse:
+    executor: ThreadPoolExecutor = Depends(get_workflow_executor),
+) -> StreamingResponse:
     """
     WorkspaceIndex 起点の Chat 実行。
 
@@ -142,34 +245,62 @@ def chat_from_workspace(
     - WorkspaceIndex を受け取る
     - Workflow に処理を委譲する
     - Diff をそのまま返却する
+
+    注意:
+    - Workflow はブロッキング処理のため worker thread に逃がす
+    - イベントループを塞がないことを最優先とする
     """
 
-    logger.info(
-        "Chat(workspace) request received: project_id=%s files=%d",
-        request.workspace.project_id,
-        len(request.workspace.files),
-    )
+    request = await _parse_body(raw_request, _WORKSPACE_REQUEST_ADAPTER)
+
+    # len() 評価を含むログは、INFO が無効な環境では
+    # 引数評価ごとスキップする
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Chat(workspace) request received: project_id=%s files=%d",
+            request.workspace.project_id,
+            len(request.workspace.files),
+        )
 
     try:
-        diff = workflow.execute_from_workspace(
-            workspace=request.workspace,
-            root_path=request.root_path,
-            requested_mode=request.mode,
-            existing_diff=request.existing_diff,
+        # ブロッキング処理（ファイル IO / LLM 呼び出し）を
+        # Workflow 専用プールに逃がし、イベントループを解放する
+        loop = asyncio.get_running_loop()
+        diff = await loop.run_in_executor(
+            executor,
+            partial(
+                workflow.execute_from_workspace,
+                workspace=request.workspace,
+                root_path=request.root_path,
+                requested_mode=request.mode,
+                existing_diff=request.existing_diff,
+            ),
         )
     except Exception as e:
-        logger.exception("Chat workflow (workspace) failed")
+        # traceback 整形はコストが高いため、DEBUG 有効時のみ付与する
+        # （障害の嵐の中で 500 応答自体を遅くしないため）
+        logger.error(
+            "Chat workflow (workspace) failed: %r",
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise HTTPException(
             status_code=500,
             detail="Chat processing from workspace failed",
         ) from e
 
-    logger.info(
-        "Chat(workspace) completed: diff_files=%d",
-        len(diff.files),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Chat(workspace) completed: diff_files=%d",
+            len(diff.files),
+        )
 
-    return ChatResponse(diff=diff)
+    # Diff は内部生成済みのため再検証せず、
+    # ファイル単位でストリーミング返却する
+    return StreamingResponse(
+        _iter_diff_response(diff),
+        media_type="application/json",
+    )
 
 
 # ============================================================
@@ -177,13 +308,27 @@ def chat_from_workspace(
 # ============================================================
 @router.post(
     "/snapshot",
-    response_model=ChatResponse,
+    # Workspace 起点と同様、レスポンス再検証はスキップする
+    responses={200: {"model": ChatResponse}},
     summary="Chat from Snapshot",
+    # ボディは _parse_body で手動パースするため、
+    # OpenAPI スキーマはここで明示する
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": ChatFromSnapshotRequest.model_json_schema(),
+                },
+            },
+        },
+    },
 )
-def chat_from_snapshot(
-    request: ChatFromSnapshotRequest,
+async def chat_from_snapshot(
+    raw_request: Request,
     workflow: Workflow = Depends(get_workflow),
-) -> ChatResponse:
+    executor: ThreadPoolExecutor = Depends(get_workflow_executor),
+) -> StreamingResponse:
     """
     Snapshot 起点の Chat 実行。
 
@@ -197,31 +342,52 @@ def chat_from_snapshot(
     - API 層で Snapshot を触らない
     """
 
-    logger.info(
-        "Chat(snapshot) request received: project_id=%s files=%d",
-        request.snapshot.project_id,
-        len(request.snapshot.files),
-    )
+    request = await _parse_body(raw_request, _SNAPSHOT_REQUEST_ADAPTER)
+
+    # Workspace 起点と同様、INFO 無効時は引数評価ごとスキップ
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Chat(snapshot) request received: project_id=%s files=%d",
+            request.snapshot.project_id,
+            len(request.snapshot.files),
+        )
 
     try:
-        diff = workflow.execute_from_snapshot(
-            snapshot=request.snapshot,
-            requested_mode=request.mode,
-            existing_diff=request.existing_diff,
+        # Workspace 起点と同様、ブロッキング処理は専用プールへ
+        loop = asyncio.get_running_loop()
+        diff = await loop.run_in_executor(
+            executor,
+            partial(
+                workflow.execute_from_snapshot,
+                snapshot=request.snapshot,
+                requested_mode=request.mode,
+                existing_diff=request.existing_diff,
+            ),
         )
     except Exception as e:
-        logger.exception("Chat workflow (snapshot) failed")
+        # Workspace 起点と同様、traceback 整形は DEBUG 有効時のみ
+        logger.error(
+            "Chat workflow (snapshot) failed: %r",
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise HTTPException(
             status_code=500,
             detail="Chat processing from snapshot failed",
         ) from e
 
-    logger.info(
-        "Chat(snapshot) completed: diff_files=%d",
-        len(diff.files),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Chat(snapshot) completed: diff_files=%d",
+            len(diff.files),
+        )
 
-    return ChatResponse(diff=diff)
+    # Diff は内部生成済みのため再検証せず、
+    # ファイル単位でストリーミング返却する
+    return StreamingResponse(
+        _iter_diff_response(diff),
+        media_type="application/json",
+    )
 
 
 # ============================================================
@@ -29,6 +29,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from backend.app.deps import get_supabase_client
@@ -47,6 +48,8 @@ logger = get_logger(__name__)
 router = APIRouter(
     prefix="/project",
     tags=["project"],
+    # 他 API とレスポンス経路を揃える（orjson 統一）
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -71,6 +74,11 @@ class ProjectCreateRequest(BaseModel):
         description="プロジェクト説明",
     )
 
+    model_config = {
+        # 想定外フィールドの混入を禁止（domain 層と同一方針）
+        "extra": "forbid",
+    }
+
 
 class ProjectResponse(BaseModel):
     """
@@ -100,7 +108,7 @@ class ProjectListResponse(BaseModel):
     "",
     response_model=ProjectResponse,
 )
-def create_project(
+async def create_project(
     request: ProjectCreateRequest,
     supabase=Depends(get_supabase_client),
 ) -> ProjectResponse:
@@ -114,31 +122,25 @@ def create_project(
 
     logger.info("Project create requested: name=%s", request.name)
 
-    try:
-        # NOTE:
-        # 現段階では Supabase 側の Project テーブル定義が
-        # 固まっていないため仮実装。
-        # infra/supabase.py に Project 用 API が追加され次第、
-        # ここは差し替える。
-        raise NotImplementedError("Project creation is not implemented yet")
-    except NotImplementedError as e:
-        raise HTTPException(
-            status_code=501,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.exception("Project creation failed")
-        raise HTTPException(
-            status_code=500,
-            detail="Project creation failed",
-        ) from e
+    # NOTE:
+    # 現段階では Supabase 側の Project テーブル定義が
+    # 固まっていないため仮実装。
+    # infra/supabase.py に Project 用 API が追加され次第、
+    # ここは差し替える。
+    #
+    # 固定レスポンスのため、例外の raise → catch 変換は挟まず
+    # HTTPException を直接返す。
+    raise HTTPException(
+        status_code=501,
+        detail="Project creation is not implemented yet",
+    )
 
 
 @router.get(
     "",
     response_model=ProjectListResponse,
 )
-def list_projects(
+async def list_projects(
     supabase=Depends(get_supabase_client),
 ) -> ProjectListResponse:
     """
@@ -150,28 +152,19 @@ def list_projects(
 
     logger.info("Project list requested")
 
-    try:
-        # NOTE:
-        # Supabase 実装待ち
-        raise NotImplementedError("Project listing is not implemented yet")
-    except NotImplementedError as e:
-        raise HTTPException(
-            status_code=501,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.exception("Project listing failed")
-        raise HTTPException(
-            status_code=500,
-            detail="Project listing failed",
-        ) from e
+    # NOTE:
+    # Supabase 実装待ち（固定 501 のため直接 raise）
+    raise HTTPException(
+        status_code=501,
+        detail="Project listing is not implemented yet",
+    )
 
 
 @router.get(
     "/{project_id}",
     response_model=ProjectResponse,
 )
-def get_project(
+async def get_project(
     project_id: str,
     supabase=Depends(get_supabase_client),
 ) -> ProjectResponse:
@@ -185,21 +178,12 @@ def get_project(
 
     logger.info("Project fetch requested: project_id=%s", project_id)
 
-    try:
-        # NOTE:
-        # Supabase 実装待ち
-        raise NotImplementedError("Project fetch is not implemented yet")
-    except NotImplementedError as e:
-        raise HTTPException(
-            status_code=501,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.exception("Project fetch failed")
-        raise HTTPException(
-            status_code=500,
-            detail="Project fetch failed",
-        ) from e
+    # NOTE:
+    # Supabase 実装待ち（固定 501 のため直接 raise）
+    raise HTTPException(
+        status_code=501,
+        detail="Project fetch is not implemented yet",
+    )
 
 
 # ============================================================
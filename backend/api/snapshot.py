@@ -22,13 +22,20 @@ Snapshot API Route
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import asyncio
+import hashlib
+from typing import Iterator
+
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.app.deps import get_snapshot_builder
 from backend.domain.workspace_index import WorkspaceIndex
 from backend.domain.snapshot import Snapshot
 from backend.infra.snapshot_builder import SnapshotBuilder
+from backend.infra.ttl_cache import TTLCache
 
 
 # ============================================================
@@ -37,6 +44,9 @@ from backend.infra.snapshot_builder import SnapshotBuilder
 router = APIRouter(
     prefix="/api/snapshot",
     tags=["snapshot"],
+    # Snapshot は全ファイル内容を含む最重量レスポンスのため
+    # orjson による高速シリアライズをデフォルトとする
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -71,18 +81,76 @@ class SnapshotBuildRequest(BaseModel):
     }
 
 
+# ============================================================
+# Build 結果キャッシュ
+# ============================================================
+#
+# 同一 WorkspaceIndex + root_path + target_paths に対する build は
+# 短時間に繰り返されやすい（UI の再試行・再描画）。
+#
+# WorkspaceIndex は各ファイルの内容ハッシュを含むため、
+# リクエスト全体のハッシュをキーにすれば
+# 「内容が変わっていない限り同じ Snapshot」とみなせる。
+#
+_build_cache: TTLCache[Snapshot] = TTLCache(maxsize=32, ttl=60.0)
+
+
+def _build_cache_key(req: "SnapshotBuildRequest") -> str:
+    """
+    SnapshotBuildRequest からキャッシュキーを生成する。
+
+    注意:
+    - キーはリクエスト内容のみに依存させる
+    - ここで判断（キャッシュ可否など）をしてはいけない
+    """
+    payload = orjson.dumps(req.model_dump(mode="json"))
+    return hashlib.sha256(payload).hexdigest()
+
+
+# ============================================================
+# レスポンス・ストリーミング
+# ============================================================
+def _iter_snapshot_response(snapshot: Snapshot) -> Iterator[bytes]:
+    """
+    Snapshot JSON をファイル単位で逐次生成する。
+
+    目的:
+    - Snapshot は全ファイル内容を含む最重量レスポンスのため、
+      一括シリアライズせずメモリ使用量を一定に保つ
+    - 最初のファイルが揃った時点で送出を開始する
+
+    注意:
+    - 出力構造は Snapshot モデルの JSON 表現と同一に保つ
+    - Snapshot の中身を解釈・加工しない
+    """
+
+    yield b'{"project_id":'
+    yield orjson.dumps(snapshot.project_id)
+    yield b',"files":['
+
+    for i, snapshot_file in enumerate(snapshot.files):
+        if i:
+            yield b","
+        yield orjson.dumps(snapshot_file.model_dump(mode="json"))
+
+    yield b"]}"
+
+
 # ============================================================
 # Endpoint
 # ============================================================
 @router.post(
     "/build",
-    response_model=Snapshot,
+    # Snapshot は SnapshotBuilder が生成した正規データのため
+    # レスポンス再検証は行わない（OpenAPI 定義のみ残す）
+    responses={200: {"model": Snapshot}},
     summary="Build Snapshot from WorkspaceIndex",
 )
-def build_snapshot(
+async def build_snapshot(
     req: SnapshotBuildRequest,
+    raw_request: Request,
     snapshot_builder: SnapshotBuilder = Depends(get_snapshot_builder),
-) -> Snapshot:
+) -> Response:
     """
     Snapshot を生成する。
 
@@ -95,16 +163,35 @@ def build_snapshot(
     - この関数は「判断」しない
     - 読めないファイルは SnapshotBuilder 側でスキップされる
     - 失敗時は例外をそのまま FastAPI に委ねる
+    - build はファイル IO を伴うため worker thread で実行する
     """
 
-    snapshot = snapshot_builder.build(
-        workspace=req.workspace,
-        root_path=req.root_path,
-        target_paths=req.target_paths,
+    cache_key = _build_cache_key(req)
+    etag = f'"{cache_key}"'
+
+    # ETag はリクエスト内容のハッシュ。
+    # WorkspaceIndex が各ファイルの内容ハッシュを含むため、
+    # 同一 ETag = 同一 Snapshot とみなせる。
+    # 一致すればボディを一切作らず 304 を返す。
+    if raw_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    snapshot = _build_cache.get(cache_key)
+    if snapshot is None:
+        snapshot = await asyncio.to_thread(
+            snapshot_builder.build,
+            workspace=req.workspace,
+            root_path=req.root_path,
+            target_paths=req.target_paths,
+        )
+        _build_cache.put(cache_key, snapshot)
+
+    return StreamingResponse(
+        _iter_snapshot_response(snapshot),
+        media_type="application/json",
+        headers={"ETag": etag},
     )
 
-    return snapshot
-
 
 # ============================================================
 # export 制御
@@ -23,11 +23,18 @@ Workspace API は
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+from functools import cache
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from backend.app.deps import get_supabase_client
 from backend.domain.workspace_index import WorkspaceIndex
+from backend.infra.ttl_cache import TTLCache
 from backend.infra.workspace_scanner import WorkspaceScanner
 from backend.infra.logger import get_logger
 
@@ -44,6 +51,9 @@ logger = get_logger(__name__)
 router = APIRouter(
     prefix="/workspace",
     tags=["workspace"],
+    # WorkspaceIndex はファイル数に比例して肥大するため
+    # orjson による高速シリアライズをデフォルトとする
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -62,6 +72,11 @@ class WorkspaceScanRequest(BaseModel):
     project_id: str = Field(description="対象プロジェクトID")
     path: str = Field(description="スキャン対象のルートパス")
 
+    model_config = {
+        # 想定外フィールドの混入を禁止（domain 層と同一方針）
+        "extra": "forbid",
+    }
+
 
 class WorkspaceResponse(BaseModel):
     """
@@ -75,15 +90,30 @@ class WorkspaceResponse(BaseModel):
     workspace: WorkspaceIndex
 
 
+# ============================================================
+# Scan 結果キャッシュ
+# ============================================================
+#
+# UI 操作中は同じ path の scan が短時間に繰り返されるため、
+# 直近の結果を短寿命キャッシュで返す。
+#
+# キーにルートディレクトリの mtime を含めることで、
+# 直下の構造変化（追加・削除）があれば自動的にミスする。
+#
+_scan_cache: TTLCache[WorkspaceIndex] = TTLCache(maxsize=128, ttl=60.0)
+
+
 # ============================================================
 # Dependencies
 # ============================================================
+@cache
 def get_workspace_scanner() -> WorkspaceScanner:
     """
-    WorkspaceScanner を生成する Dependency。
+    WorkspaceScanner を取得する Dependency。
 
     注意:
-    - Scanner は状態を持たないため、毎回生成して問題ない
+    - Scanner は状態を持たないため、毎回生成せず
+      プロセス内で単一インスタンスを使い回す
     - API 層は「生成と呼び出し」までに責務を限定する
     """
     return WorkspaceScanner()
@@ -94,13 +124,15 @@ def get_workspace_scanner() -> WorkspaceScanner:
 # ============================================================
 @router.post(
     "/scan",
-    response_model=WorkspaceResponse,
+    # scan 済み WorkspaceIndex を再検証しないため
+    # response_model ではなく responses でスキーマのみ与える
+    responses={200: {"model": WorkspaceResponse}},
 )
-def scan_workspace(
+async def scan_workspace(
     request: WorkspaceScanRequest,
     supabase=Depends(get_supabase_client),
     scanner: WorkspaceScanner = Depends(get_workspace_scanner),
-) -> WorkspaceResponse:
+) -> ORJSONResponse:
     """
     Workspace をスキャンして WorkspaceIndex を生成する。
 
@@ -122,35 +154,66 @@ def scan_workspace(
     )
 
     try:
-        workspace = scanner.scan(
-            project_id=request.project_id,
-            root_path=request.path,
-        )
+        # ルートの mtime をキーに含め、構造変化があればミスさせる
+        try:
+            root_mtime = os.stat(request.path).st_mtime_ns
+        except OSError:
+            root_mtime = None
+
+        cache_key = (request.project_id, request.path, root_mtime)
+
+        workspace = _scan_cache.get(cache_key)
+        if workspace is not None:
+            logger.info(
+                "Workspace scan cache hit: project_id=%s path=%s",
+                request.project_id,
+                request.path,
+            )
+        else:
+            # scan はディスク走査（ブロッキング IO）のため
+            # worker thread に逃がしてイベントループを解放する
+            workspace = await asyncio.to_thread(
+                scanner.scan,
+                project_id=request.project_id,
+                root_path=request.path,
+            )
+            _scan_cache.put(cache_key, workspace)
     except Exception as e:
         # infra 層の例外は API 層で HTTP エラーに変換する
-        logger.exception("Workspace scan failed")
+        # traceback 整形はコストが高いため DEBUG 有効時のみ付与する
+        logger.error(
+            "Workspace scan failed: %r",
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise HTTPException(
             status_code=500,
             detail="Workspace scan failed",
         ) from e
 
-    logger.info(
-        "Workspace scan completed: project_id=%s files=%d",
-        request.project_id,
-        len(workspace.files),
-    )
+    # len() 評価を含むログは、INFO が無効な環境では
+    # 引数評価ごとスキップする
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Workspace scan completed: project_id=%s files=%d",
+            request.project_id,
+            len(workspace.files),
+        )
 
-    return WorkspaceResponse(workspace=workspace)
+    # WorkspaceIndex は内部生成済みのため再検証せずそのまま返す
+    return ORJSONResponse(
+        content={"workspace": workspace.model_dump(mode="json")}
+    )
 
 
 @router.get(
     "/{project_id}",
-    response_model=WorkspaceResponse,
+    responses={200: {"model": WorkspaceResponse}},
 )
-def get_workspace(
+async def get_workspace(
     project_id: str,
     supabase=Depends(get_supabase_client),
-) -> WorkspaceResponse:
+) -> ORJSONResponse:
     """
     既存 WorkspaceIndex を取得する。
 
@@ -161,22 +224,14 @@ def get_workspace(
 
     logger.info("Workspace fetch requested: project_id=%s", project_id)
 
-    try:
-        # NOTE:
-        # 現時点では WorkspaceIndex の永続化は未実装。
-        # infra/supabase.py 側で取得処理が定義されるまでは 501 を返す。
-        raise NotImplementedError("Workspace fetch is not implemented yet")
-    except NotImplementedError as e:
-        raise HTTPException(
-            status_code=501,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.exception("Workspace fetch failed")
-        raise HTTPException(
-            status_code=500,
-            detail="Workspace fetch failed",
-        ) from e
+    # NOTE:
+    # 現時点では WorkspaceIndex の永続化は未実装。
+    # infra/supabase.py 側で取得処理が定義されるまでは 501 を返す。
+    # 固定レスポンスのため、例外の raise → catch 変換は挟まない。
+    raise HTTPException(
+        status_code=501,
+        detail="Workspace fetch is not implemented yet",
+    )
 
 
 # ============================================================
@@ -23,28 +23,6 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 
-# ============================================================
-# .env 読み込み（起動時に一度だけ）
-# ============================================================
-#
-# 方針:
-# - .env を「ここでだけ」読み込む
-# - 他の層で dotenv を触らせない
-# - os.getenv を使う既存設計はそのまま維持
-#
-# 注意:
-# - .env が存在しなくても例外にはしない
-#   （本番では OS 環境変数を使う前提のため）
-#
-try:
-    from dotenv import load_dotenv
-
-    load_dotenv()
-except Exception:
-    # python-dotenv 未導入 or .env 不在でも黙って進む
-    pass
-
-
 # ============================================================
 # 環境変数キー（ここに集約）
 # ============================================================
@@ -67,6 +45,13 @@ ENV_LLM_MAX_TOKENS = "LLM_MAX_TOKENS"
 
 ENV_APP_ENV = "APP_ENV"  # "local" / "prod" 等（厳密な運用は main/app 側で扱う）
 
+# 未設定だと起動を中止する必須キー
+_REQUIRED_ENV_KEYS = (
+    ENV_SUPABASE_URL,
+    ENV_SUPABASE_SERVICE_ROLE_KEY,
+    ENV_OPENAI_API_KEY,
+)
+
 
 # ============================================================
 # デフォルト値（ここに集約）
@@ -81,10 +66,33 @@ DEFAULT_LLM_MAX_TOKENS = 2048
 DEFAULT_APP_ENV = "local"
 
 
+# ============================================================
+# .env 読み込み（ローカル環境のみ・起動時に一度だけ）
+# ============================================================
+#
+# 方針:
+# - .env を「ここでだけ」読み込む
+# - 他の層で dotenv を触らせない
+# - 本番（APP_ENV != local）では orchestrator が環境変数を
+#   注入する前提のため、.env 探索のファイルシステム走査ごと省く
+#
+# 注意:
+# - .env が存在しなくても例外にはしない
+#
+if os.environ.get(ENV_APP_ENV, DEFAULT_APP_ENV) == DEFAULT_APP_ENV:
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except Exception:
+        # python-dotenv 未導入 or .env 不在でも黙って進む
+        pass
+
+
 # ============================================================
 # Settings（読み取り専用の設定オブジェクト）
 # ============================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     Backend 設定の不変オブジェクト。
@@ -92,6 +100,8 @@ class Settings:
     注意:
     - これは「設定値の入れ物」であり、ロジックを持たせない
     - 生成後は不変（frozen）として扱い、差し替えは再生成で行う
+    - slots=True によりインスタンス辞書を持たず、
+      属性参照をスロット経由の固定コストにする
     """
 
     # 実行環境（local / prod 等）
@@ -129,32 +139,54 @@ class Settings:
           （後で原因追跡が困難になるため）
         """
 
-        app_env = os.getenv(ENV_APP_ENV, DEFAULT_APP_ENV)
-        log_level = os.getenv(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
+        # os.environ を一度だけ参照し、以降は辞書 lookup で済ませる
+        # （os.getenv のラッパ呼び出しをキーごとに繰り返さない）
+        env = os.environ
+
+        app_env = env.get(ENV_APP_ENV, DEFAULT_APP_ENV)
+        log_level = env.get(ENV_LOG_LEVEL, DEFAULT_LOG_LEVEL)
 
-        supabase_url = os.getenv(ENV_SUPABASE_URL)
-        supabase_key = os.getenv(ENV_SUPABASE_SERVICE_ROLE_KEY)
+        supabase_url = env.get(ENV_SUPABASE_URL)
+        supabase_key = env.get(ENV_SUPABASE_SERVICE_ROLE_KEY)
 
-        openai_api_key = os.getenv(ENV_OPENAI_API_KEY)
+        openai_api_key = env.get(ENV_OPENAI_API_KEY)
 
-        if not supabase_url:
-            raise RuntimeError(f"{ENV_SUPABASE_URL} が設定されていません")
-        if not supabase_key:
-            raise RuntimeError(f"{ENV_SUPABASE_SERVICE_ROLE_KEY} が設定されていません")
-        if not openai_api_key:
-            raise RuntimeError(f"{ENV_OPENAI_API_KEY} が設定されていません")
+        # 必須キーは一括で検証し、不足分をまとめて報告する
+        # （1 つずつ失敗させると設定ミスの往復回数が増える）
+        missing = [
+            key
+            for key in _REQUIRED_ENV_KEYS
+            if not env.get(key)
+        ]
+        if missing:
+            raise RuntimeError(
+                f"必須環境変数が設定されていません: {', '.join(missing)}"
+            )
 
-        llm_model = os.getenv(ENV_LLM_MODEL, DEFAULT_LLM_MODEL)
+        llm_model = env.get(ENV_LLM_MODEL, DEFAULT_LLM_MODEL)
 
         # 数値系は「型として正しいこと」を強制する
-        llm_temperature = _get_float_env(
-            ENV_LLM_TEMPERATURE,
-            DEFAULT_LLM_TEMPERATURE,
-        )
-        llm_max_tokens = _get_int_env(
-            ENV_LLM_MAX_TOKENS,
-            DEFAULT_LLM_MAX_TOKENS,
-        )
+        # （呼び出しは起動時の一度だけなので、ヘルパー関数に
+        #   切り出さずインラインで変換し、失敗時はまとめて報告する）
+        raw_temperature = env.get(ENV_LLM_TEMPERATURE)
+        raw_max_tokens = env.get(ENV_LLM_MAX_TOKENS)
+        try:
+            llm_temperature = (
+                float(raw_temperature)
+                if raw_temperature
+                else DEFAULT_LLM_TEMPERATURE
+            )
+            llm_max_tokens = (
+                int(raw_max_tokens)
+                if raw_max_tokens
+                else DEFAULT_LLM_MAX_TOKENS
+            )
+        except ValueError as e:
+            raise RuntimeError(
+                "LLM 数値設定の変換に失敗しました: "
+                f"{ENV_LLM_TEMPERATURE}={raw_temperature!r}, "
+                f"{ENV_LLM_MAX_TOKENS}={raw_max_tokens!r}"
+            ) from e
 
         return Settings(
             app_env=app_env,
@@ -168,46 +200,6 @@ class Settings:
         )
 
 
-# ============================================================
-# 内部ユーティリティ（設定読み取り補助）
-# ============================================================
-def _get_int_env(key: str, default: int) -> int:
-    """
-    環境変数を int として読み取る。
-
-    注意:
-    - 失敗時に黙って default に戻すのではなく、例外を投げる
-      （設定ミスを早期に露出させる）
-    """
-    raw = os.getenv(key)
-    if raw is None or raw == "":
-        return default
-    try:
-        return int(raw)
-    except ValueError as e:
-        raise RuntimeError(
-            f"{key} は int である必要があります: value={raw!r}"
-        ) from e
-
-
-def _get_float_env(key: str, default: float) -> float:
-    """
-    環境変数を float として読み取る。
-
-    注意:
-    - 失敗時に黙って default に戻すのではなく、例外を投げる
-    """
-    raw = os.getenv(key)
-    if raw is None or raw == "":
-        return default
-    try:
-        return float(raw)
-    except ValueError as e:
-        raise RuntimeError(
-            f"{key} は float である必要があります: value={raw!r}"
-        ) from e
-
-
 __all__ = [
     "Settings",
     # env keys
@@ -23,7 +23,10 @@ deps.py は
 
 from __future__ import annotations
 
-from functools import lru_cache
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Optional
 
 from backend.app.config import Settings
 
@@ -36,7 +39,6 @@ from backend.services.prompt_builder import PromptBuilder
 
 from backend.infra.snapshot_builder import SnapshotBuilder
 from backend.infra.logger import get_logger
-from backend.infra.supabase import create_supabase_client
 
 
 # ============================================================
@@ -48,7 +50,15 @@ logger = get_logger(__name__)
 # ============================================================
 # Settings
 # ============================================================
-@lru_cache
+#
+# get_settings / get_supabase_client は全リクエストの依存解決で
+# 呼ばれるため、lru_cache の「引数タプルのハッシュ + ロック +
+# 辞書 lookup」すら省き、モジュール変数の単純参照にする。
+#
+_settings: Optional[Settings] = None
+_supabase_client = None
+
+
 def get_settings() -> Settings:
     """
     Settings を取得する。
@@ -57,14 +67,20 @@ def get_settings() -> Settings:
     - 起動中は同一インスタンスを使い回す
     - 設定変更が必要な場合はプロセス再起動を前提とする
     """
-    logger.info("Loading application settings")
-    return Settings.from_env()
+    global _settings
+
+    settings = _settings
+    if settings is None:
+        logger.info("Loading application settings")
+        settings = Settings.from_env()
+        _settings = settings
+
+    return settings
 
 
 # ============================================================
 # Infra Layer
 # ============================================================
-@lru_cache
 def get_supabase_client():
     """
     Supabase Client を取得する。
@@ -73,20 +89,33 @@ def get_supabase_client():
     - infra/supabase.py が唯一の生成責務を持つ
     - この関数は「参照点」として存在する
     """
-    logger.info("Creating Supabase client")
-    return create_supabase_client()
+    global _supabase_client
+
+    client = _supabase_client
+    if client is None:
+        # Supabase SDK は重いため、初回利用時まで import を遅延する
+        # （/health などは SDK を一切ロードせずに応答できる）
+        from backend.infra.supabase import create_supabase_client
+
+        logger.info("Creating Supabase client")
+        client = create_supabase_client()
+        _supabase_client = client
+
+    return client
 
 
+@cache
 def get_snapshot_builder() -> SnapshotBuilder:
     """
-    SnapshotBuilder を生成する。
+    SnapshotBuilder を取得する。
 
     SnapshotBuilder の責務:
     - WorkspaceIndex + root_path から Snapshot を構築する
     - ファイル読み取り以外の判断を行わない
 
     注意:
-    - 状態を持たないためキャッシュ不要
+    - 状態を持たないため、リクエストごとに再生成せず
+      プロセス内で単一インスタンスを使い回す
     """
     return SnapshotBuilder()
 
@@ -94,13 +123,15 @@ def get_snapshot_builder() -> SnapshotBuilder:
 # ============================================================
 # Services Layer
 # ============================================================
+@cache
 def get_llm_service() -> LLMService:
     """
-    LLMService を生成する。
+    LLMService を取得する。
 
     注意:
     - Settings からモデル設定を受け取る
-    - LLMService 自体は状態を持たないためキャッシュしない
+    - 状態を持たないためプロセス内で単一インスタンスを使い回す
+    - 設定変更はプロセス再起動で反映する（Settings と同方針）
     """
     settings = get_settings()
 
@@ -111,12 +142,13 @@ def get_llm_service() -> LLMService:
     )
 
 
+@cache
 def get_prompt_builder() -> PromptBuilder:
     """
-    PromptBuilder を生成する。
+    PromptBuilder を取得する。
 
     注意:
-    - 状態を持たないため、毎回新規生成で問題ない
+    - 状態を持たないため、毎回生成せず使い回す
     """
     return PromptBuilder()
 
@@ -124,23 +156,25 @@ def get_prompt_builder() -> PromptBuilder:
 # ============================================================
 # Core Layer
 # ============================================================
+@cache
 def get_mode_router() -> ModeRouter:
     """
-    ModeRouter を生成する。
+    ModeRouter を取得する。
 
     注意:
-    - 状態を持たないためキャッシュ不要
+    - 状態を持たないためプロセス内で単一インスタンスを使い回す
     """
     return ModeRouter()
 
 
+@cache
 def get_dev_engine() -> DevEngine:
     """
-    DevEngine を生成する。
+    DevEngine を取得する。
 
     注意:
     - 依存する全コンポーネントをここで注入する
-    - DevEngine 自身は状態を持たない
+    - DevEngine 自身は状態を持たないため使い回す
     """
     return DevEngine(
         llm_service=get_llm_service(),
@@ -149,13 +183,39 @@ def get_dev_engine() -> DevEngine:
     )
 
 
+@cache
+def get_workflow_executor() -> ThreadPoolExecutor:
+    """
+    Workflow 実行専用の Executor を取得する。
+
+    目的:
+    - Workflow（Snapshot 構築 / LLM 呼び出し）の実行を
+      専用プールに隔離し、asyncio.to_thread の共有プールを
+      他のブロッキング処理のために空けておく
+    - worker 数を CPU コア数で抑え、過剰な並列実行で
+      メモリが膨らむのを防ぐ
+
+    注意:
+    - ProcessPool は使わない。Workflow は OpenAI クライアントを
+      内包し pickle できず、Snapshot 全文の pickle コストが
+      GIL 回避の利得を上回るため
+    """
+    return ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 4,
+        thread_name_prefix="workflow",
+    )
+
+
+@cache
 def get_workflow() -> Workflow:
     """
-    Workflow を生成する。
+    Workflow を取得する。
 
     注意:
     - Workflow は Backend 実行フローの唯一の入口
     - Workspace / Snapshot どちらの入口も内包する
+    - 状態を持たないため、リクエストごとの再構築は行わず
+      プロセス内で単一インスタンスを使い回す
     """
     return Workflow(
         mode_router=get_mode_router(),
@@ -185,4 +245,5 @@ __all__ = [
     "get_mode_router",
     "get_dev_engine",
     "get_workflow",
+    "get_workflow_executor",
 ]
\ No newline at end of file
@@ -24,17 +24,86 @@ main.py は
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from backend.app.config import Settings
-from backend.app.deps import get_settings
+from backend.app.deps import get_settings, get_supabase_client, get_workflow
 from backend.api.chat import router as chat_router
 from backend.api.workspace import router as workspace_router
 from backend.api.project import router as project_router
 from backend.api.snapshot import router as snapshot_router
 from backend.infra.logger import get_logger
-from dotenv import load_dotenv
-load_dotenv()
+
+# .env の読み込みは backend/app/config.py に一元化されている
+# （server.py で重ねて load_dotenv しない）
+
+
+# ============================================================
+# Router 一覧（登録順を一箇所で固定する）
+# ============================================================
+_ROUTERS = (
+    chat_router,
+    workspace_router,
+    project_router,
+    snapshot_router,
+)
+
+
+# ============================================================
+# Health Check
+# ============================================================
+def health_check() -> dict:
+    """
+    ヘルスチェック用エンドポイント。
+
+    注意:
+    - 依存確認は行わない
+    - 軽量で即時応答できることを優先
+    - create_app() 内のクロージャにせずモジュール関数とし、
+      app 生成ごとの閉包割り当てを避ける（テストからも直接呼べる）
+    """
+    return {
+        "status": "ok",
+        "env": get_settings().app_env,
+    }
+
+
+# ============================================================
+# FastAPI 内部キャッシュ（シグネチャ解析）
+# ============================================================
+def _install_signature_cache() -> None:
+    """
+    FastAPI のエンドポイント・シグネチャ解析をキャッシュする。
+
+    背景:
+    - FastAPI は依存ツリー解決のたびに inspect.signature 相当の
+      解析を同じ callable に対して繰り返す
+    - upstream では fastapi#13974 で同様のキャッシュが入る予定
+
+    方針:
+    - 解析結果は callable ごとに不変のため lru_cache で包む
+    - FastAPI の内部構造が変わっていたら黙って何もしない
+      （このパッチは最適化であり、機能要件ではない）
+    """
+
+    try:
+        from fastapi.dependencies import utils as _dep_utils
+
+        original = _dep_utils.get_typed_signature
+
+        # 二重適用を防ぐ
+        if getattr(original, "__wrapped__", None) is not None:
+            return
+
+        _dep_utils.get_typed_signature = lru_cache(maxsize=1024)(original)
+    except (ImportError, AttributeError):
+        # FastAPI 側にキャッシュが内蔵された／構造が変わった場合は
+        # このパッチを適用しない
+        pass
 
 
 # ============================================================
@@ -55,6 +124,9 @@ def create_app() -> FastAPI:
     # --------------------------------------------------------
     settings: Settings = get_settings()
 
+    # Router 登録前に適用する（登録時に解析が走るため）
+    _install_signature_cache()
+
     logger = get_logger(__name__)
     logger.info("Starting ai-workbench backend")
     logger.info("App environment: %s", settings.app_env)
@@ -68,6 +140,16 @@ def create_app() -> FastAPI:
         version="0.1.0",
     )
 
+    # --------------------------------------------------------
+    # Middleware
+    # --------------------------------------------------------
+    #
+    # WorkspaceIndex / Diff / Snapshot の JSON は
+    # パス接頭辞・ソース本文の繰り返しが多く圧縮が良く効く。
+    # 小さなレスポンス（ヘルスチェック等）は素通しする。
+    #
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # --------------------------------------------------------
     # Routers
     # --------------------------------------------------------
@@ -75,27 +157,79 @@ def create_app() -> FastAPI:
     # ルータはここで一元登録する。
     # 各 API ファイルが勝手に app を触らない設計。
     #
-    app.include_router(chat_router)
-    app.include_router(workspace_router)
-    app.include_router(project_router)
-    app.include_router(snapshot_router)
+    for router in _ROUTERS:
+        app.include_router(router)
+
+    # --------------------------------------------------------
+    # リクエストモデルの事前構築
+    # --------------------------------------------------------
+    #
+    # from __future__ import annotations 下の前方参照解決を
+    # 「最初のリクエスト」ではなく起動時に済ませ、
+    # コールドスタートの初回レイテンシを潰す。
+    #
+    from backend.api.chat import (
+        ChatFromSnapshotRequest,
+        ChatFromWorkspaceRequest,
+    )
+    from backend.api.snapshot import SnapshotBuildRequest
+    from backend.api.workspace import WorkspaceScanRequest
+
+    for request_model in (
+        ChatFromWorkspaceRequest,
+        ChatFromSnapshotRequest,
+        SnapshotBuildRequest,
+        WorkspaceScanRequest,
+    ):
+        request_model.model_rebuild()
+
+    # --------------------------------------------------------
+    # Startup: 依存ウォームアップ
+    # --------------------------------------------------------
+    #
+    # Supabase / OpenAI クライアントは遅延 import のため、
+    # 何もしなければ初回リクエストが SDK ロード + DNS +
+    # TLS ハンドシェイクを背負うことになる。
+    # 起動時に一度だけ温めておく
+    # （起動数百 ms と引き換えに初回リクエストの P99 を下げる）。
+    #
+    # 二つの系列は独立しているため並行に温める:
+    # - Workflow チェーン（OpenAI SDK import を含む）
+    # - Supabase 接続（軽量クエリでプール確立）
+    #
+    @app.on_event("startup")
+    async def _warm_dependencies() -> None:
+        def _warm_workflow() -> None:
+            try:
+                # provider チェーン全体（LLMService / PromptBuilder /
+                # DevEngine / Workflow）がここで一括構築される
+                get_workflow()
+            except Exception:
+                logger.warning("Workflow warm-up failed", exc_info=True)
+
+        def _warm_supabase() -> None:
+            try:
+                client = get_supabase_client()
+                (
+                    client.table("workspace_indexes")
+                    .select("project_id")
+                    .limit(1)
+                    .execute()
+                )
+            except Exception:
+                # ウォームアップはあくまで最適化。
+                # 失敗しても起動は続行する（初回リクエストが代わりに払う）
+                logger.warning("Supabase warm-up probe failed", exc_info=True)
+
+        await asyncio.gather(
+            asyncio.to_thread(_warm_workflow),
+            asyncio.to_thread(_warm_supabase),
+        )
 
     # --------------------------------------------------------
     # Health Check
     # --------------------------------------------------------
-    @app.get("/health")
-    def health_check() -> dict:
-        """
-        ヘルスチェック用エンドポイント。
-
-        注意:
-        - 依存確認は行わない
-        - 軽量で即時応答できることを優先
-        """
-        return {
-            "status": "ok",
-            "env": settings.app_env,
-        }
+    app.get("/health")(health_check)
 
     logger.info("Application setup completed")
 
@@ -112,6 +246,38 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
+# ============================================================
+# 直接起動用エントリ
+# ============================================================
+#
+# `python -m backend.app.server` での起動を想定する。
+#
+# 方針:
+# - uvloop / httptools が導入されていれば使用する
+#   （イベントループ・HTTP パーサのオーバーヘッド削減）
+# - 未導入環境では asyncio / h11 に自動フォールバックする
+# - 本番のプロセス数・ポートは運用側（起動コマンド）で制御する
+#
+if __name__ == "__main__":
+    import uvicorn
+
+    def _pick(module_name: str, value: str) -> str:
+        """導入済みの場合のみ高速実装を選択する。"""
+        try:
+            __import__(module_name)
+            return value
+        except ImportError:
+            return "auto"
+
+    uvicorn.run(
+        "backend.app.server:app",
+        host="127.0.0.1",
+        port=8000,
+        loop=_pick("uvloop", "uvloop"),
+        http=_pick("httptools", "httptools"),
+    )
+
+
 # ============================================================
 # 使用上の注意（設計固定）
 # ============================================================
@@ -28,6 +28,7 @@ Backend の「手」ではない。
 
 from __future__ import annotations
 
+import logging
 from typing import Optional
 
 from backend.domain.snapshot import Snapshot
@@ -92,6 +93,10 @@ class DevEngine:
         self._prompt_builder = prompt_builder
         self._snapshot_builder = snapshot_builder
 
+        # System プロンプトはリクエスト入力に依存しない静的文字列のため、
+        # 初期化時に一度だけ構築し、run() ごとの再テンプレート処理を省く
+        self._system_prompt = prompt_builder.build_system_prompt()
+
         logger.info("DevEngine initialized")
 
     # --------------------------------------------------------
@@ -120,11 +125,14 @@ class DevEngine:
         - Diff（変更提案）
         """
 
-        logger.info(
-            "DevEngine run_from_workspace started: project_id=%s files=%d",
-            workspace.project_id,
-            len(workspace.files),
-        )
+        # 実行ごとの開始ログは DEBUG に落とす
+        # （INFO 運用時のハンドラ呼び出しと len() 評価を省く）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "DevEngine run_from_workspace started: project_id=%s files=%d",
+                workspace.project_id,
+                len(workspace.files),
+            )
 
         # ----------------------------------------------------
         # Snapshot 構築
@@ -139,11 +147,12 @@ class DevEngine:
             target_paths=None,  # 現段階では全体 Snapshot
         )
 
-        logger.info(
-            "Snapshot built for DevEngine: project_id=%s snapshot_files=%d",
-            snapshot.project_id,
-            len(snapshot.files),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Snapshot built for DevEngine: project_id=%s snapshot_files=%d",
+                snapshot.project_id,
+                len(snapshot.files),
+            )
 
         # Snapshot を元に、共通の run() を呼び出す
         return self.run(
@@ -180,16 +189,19 @@ class DevEngine:
         - Diff の正当性保証は行わない
         """
 
-        logger.info(
-            "DevEngine run started: project_id=%s snapshot_files=%d",
-            snapshot.project_id,
-            len(snapshot.files),
-        )
+        # 開始ログは DEBUG（完了ログのみ INFO に残す）
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "DevEngine run started: project_id=%s snapshot_files=%d",
+                snapshot.project_id,
+                len(snapshot.files),
+            )
 
         # ----------------------------------------------------
         # プロンプト生成
         # ----------------------------------------------------
-        system_prompt = self._prompt_builder.build_system_prompt()
+        # System プロンプトは __init__ で構築済みのものを再利用する
+        system_prompt = self._system_prompt
         user_prompt = self._prompt_builder.build_user_prompt(
             snapshot=snapshot,
             diff=existing_diff,
@@ -217,10 +229,12 @@ class DevEngine:
             response_text=llm_response,
         )
 
-        logger.info(
-            "DevEngine run completed: diff_files=%d",
-            len(diff.files),
-        )
+        # 実行単位の可観測性のため、完了ログだけは INFO に残す
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "DevEngine run completed: diff_files=%d",
+                len(diff.files),
+            )
 
         return diff
 
@@ -238,25 +252,32 @@ class DevEngine:
         現段階の方針:
         - Snapshot に含まれる全ファイルを対象にする
         - BEFORE は Snapshot の生データ
-        - AFTER は LLM 応答全文（仮）
+        - AFTER は空（パーサ実装までの暫定）
+        - LLM 応答全文は Diff.raw_response に一度だけ保持する
+
+        以前は応答全文を全 DiffFile.after に複製していたが、
+        シリアライズ時に O(ファイル数 × 応答長) のバイト数に
+        膨らむため、Diff 全体で一度だけ持つ形に改めた。
 
         ※ この処理は将来的に段階的に分離・精密化される。
         """
 
-        diff_files: list[DiffFile] = []
-
-        for file in snapshot.files:
-            diff_files.append(
-                DiffFile(
-                    path=file.path,
-                    before=file.content,
-                    after=response_text,
-                )
+        # append の逐次呼び出しよりも内包表記の方が
+        # インタプリタのディスパッチ回数が少なく、
+        # ファイル数に比例して効いてくる
+        diff_files: list[DiffFile] = [
+            DiffFile(
+                path=file.path,
+                before=file.content,
+                after="",
             )
+            for file in snapshot.files
+        ]
 
         return Diff(
             project_id=snapshot.project_id,
             files=diff_files,
+            raw_response=response_text,
         )
 
 
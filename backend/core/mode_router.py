@@ -24,6 +24,7 @@ Mode Router は
 
 from __future__ import annotations
 
+import logging
 from enum import Enum
 from typing import Optional
 
@@ -56,6 +57,14 @@ class Mode(str, Enum):
     CASUAL = "casual"
 
 
+# 値 → Mode の逆引きテーブル
+#
+# Mode("dev") は Enum の __call__ → メンバーシップ判定 →
+# ValueError 包み込みまで Python レベルで通るため、
+# 実体である逆引き辞書を直接参照して 1 回の辞書 lookup に潰す
+_MODE_MAP = Mode._value2member_map_
+
+
 # ============================================================
 # Mode Router
 # ============================================================
@@ -87,17 +96,17 @@ class ModeRouter:
         - ここでエラーにはしない（上位フローで制御する）
         """
 
-        logger.debug("Resolving mode: requested_mode=%s", requested_mode)
-
-        if not requested_mode:
-            logger.info("No mode specified. Fallback to DEV mode.")
+        # 空文字・空白のみの指定は未指定と同じ扱いにする
+        # （" dev " のような入力で warning 経路に落とさない）
+        if not requested_mode or not (key := requested_mode.strip()):
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("No mode specified. Fallback to DEV mode.")
             return Mode.DEV
 
-        try:
-            mode = Mode(requested_mode)
-            logger.info("Resolved mode: %s", mode.value)
-            return mode
-        except ValueError:
+        # Enum 構築（例外機構込み）を避け、逆引き辞書を直接引く
+        # 表記ゆれは小文字化のみ許容する（"DEV" → "dev"）
+        mode = _MODE_MAP.get(key.lower())
+        if mode is None:
             # 不正な mode 指定は警告に留める
             logger.warning(
                 "Invalid mode specified: %s. Fallback to DEV mode.",
@@ -105,6 +114,10 @@ class ModeRouter:
             )
             return Mode.DEV
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Resolved mode: %s", mode.value)
+        return mode
+
 
 # ============================================================
 # 使用上の注意（設計固定）
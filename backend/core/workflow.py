@@ -31,6 +31,7 @@ Workflow は
 
 from __future__ import annotations
 
+import logging
 from typing import Optional
 
 from backend.domain.snapshot import Snapshot
@@ -47,6 +48,15 @@ from backend.infra.logger import get_logger
 logger = get_logger(__name__)
 
 
+# ============================================================
+# Mode → 表示用文字列（事前解決）
+# ============================================================
+#
+# mode.value は Enum の descriptor 経由のため、
+# ログで使う文字列はモジュールロード時に引き切っておく
+_MODE_VALUES = {m: m.value for m in Mode}
+
+
 # ============================================================
 # Workflow
 # ============================================================
@@ -84,8 +94,52 @@ class Workflow:
         self._mode_router = mode_router
         self._dev_engine = dev_engine
 
+        # resolve_mode は毎リクエスト呼ぶため、bound method を
+        # ここで束縛して属性 2 段参照（router → メソッド）を 1 回にする
+        self._resolve_mode = mode_router.resolve_mode
+
+        # Mode → 実処理の dispatch テーブル（事前束縛）
+        #
+        # - if/elif の分岐と属性解決をリクエストごとに
+        #   繰り返さず、辞書 lookup 1 回 + 呼び出しに潰す
+        # - 現段階では CASUAL は DEV フローにフォールバックする
+        #   （分岐させる場合はエントリの差し替えだけで済む）
+        self._dispatch_workspace = {
+            Mode.DEV: dev_engine.run_from_workspace,
+            Mode.CASUAL: dev_engine.run_from_workspace,
+        }
+        self._dispatch_snapshot = {
+            Mode.DEV: dev_engine.run,
+            Mode.CASUAL: dev_engine.run,
+        }
+
         logger.info("Workflow initialized")
 
+    # --------------------------------------------------------
+    # 内部処理（共通 dispatch）
+    # --------------------------------------------------------
+    def _dispatch(
+        self,
+        requested_mode: Optional[str],
+        handler_map: dict,
+        **kwargs,
+    ) -> Diff:
+        """
+        Mode を解決し、対応するハンドラへ委譲する。
+
+        両入口（Workspace / Snapshot）で重複していた
+        「Mode 解決 → テーブル lookup → 呼び出し」を一本化する。
+        """
+        mode = self._resolve_mode(requested_mode)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Workflow mode resolved: %s", _MODE_VALUES[mode])
+
+        handler = handler_map.get(mode)
+        if handler is None:
+            raise RuntimeError(f"Unhandled mode: {mode}")
+
+        return handler(**kwargs)
+
     # --------------------------------------------------------
     # Public API（Workspace 起点）
     # --------------------------------------------------------
@@ -113,45 +167,31 @@ class Workflow:
         - Workflow は順序制御のみを行う
         """
 
-        logger.info(
-            "Workflow execution (workspace) started: project_id=%s files=%d",
-            workspace.project_id,
-            len(workspace.files),
-        )
-
-        # ----------------------------------------------------
-        # Mode 解決
-        # ----------------------------------------------------
-        mode = self._mode_router.resolve_mode(requested_mode)
-        logger.info("Workflow mode resolved: %s", mode.value)
+        # len() を含む引数評価ごとスキップできるよう guard する
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Workflow execution (workspace) started: project_id=%s files=%d",
+                workspace.project_id,
+                len(workspace.files),
+            )
 
         # ----------------------------------------------------
-        # Mode ごとの処理分岐
+        # Mode 解決 + dispatch（共通処理）
         # ----------------------------------------------------
-        if mode == Mode.DEV:
-            diff = self._dev_engine.run_from_workspace(
-                workspace=workspace,
-                root_path=root_path,
-                existing_diff=existing_diff,
-            )
+        diff = self._dispatch(
+            requested_mode,
+            self._dispatch_workspace,
+            workspace=workspace,
+            root_path=root_path,
+            existing_diff=existing_diff,
+        )
 
-        elif mode == Mode.CASUAL:
-            # 現段階では DEV フローにフォールバック
-            logger.info("CASUAL mode currently falls back to DEV flow")
-            diff = self._dev_engine.run_from_workspace(
-                workspace=workspace,
-                root_path=root_path,
-                existing_diff=existing_diff,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Workflow execution (workspace) completed: diff_files=%d",
+                len(diff.files),
             )
 
-        else:
-            raise RuntimeError(f"Unhandled mode: {mode}")
-
-        logger.info(
-            "Workflow execution (workspace) completed: diff_files=%d",
-            len(diff.files),
-        )
-
         return diff
 
     # --------------------------------------------------------
@@ -176,42 +216,30 @@ class Workflow:
         - Workflow は Snapshot を一切加工しない
         """
 
-        logger.info(
-            "Workflow execution (snapshot) started: project_id=%s files=%d",
-            snapshot.project_id,
-            len(snapshot.files),
-        )
-
-        # ----------------------------------------------------
-        # Mode 解決
-        # ----------------------------------------------------
-        mode = self._mode_router.resolve_mode(requested_mode)
-        logger.info("Workflow mode resolved: %s", mode.value)
+        # len() を含む引数評価ごとスキップできるよう guard する
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Workflow execution (snapshot) started: project_id=%s files=%d",
+                snapshot.project_id,
+                len(snapshot.files),
+            )
 
         # ----------------------------------------------------
-        # Mode ごとの処理分岐
+        # Mode 解決 + dispatch（共通処理）
         # ----------------------------------------------------
-        if mode == Mode.DEV:
-            diff = self._dev_engine.run(
-                snapshot=snapshot,
-                existing_diff=existing_diff,
-            )
+        diff = self._dispatch(
+            requested_mode,
+            self._dispatch_snapshot,
+            snapshot=snapshot,
+            existing_diff=existing_diff,
+        )
 
-        elif mode == Mode.CASUAL:
-            logger.info("CASUAL mode currently falls back to DEV flow")
-            diff = self._dev_engine.run(
-                snapshot=snapshot,
-                existing_diff=existing_diff,
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Workflow execution (snapshot) completed: diff_files=%d",
+                len(diff.files),
             )
 
-        else:
-            raise RuntimeError(f"Unhandled mode: {mode}")
-
-        logger.info(
-            "Workflow execution (snapshot) completed: diff_files=%d",
-            len(diff.files),
-        )
-
         return diff
 
 
@@ -114,6 +114,14 @@ class Character(BaseModel):
     }
 
 
+# -----------------------------
+# スキーマ事前構築
+# -----------------------------
+# 前方参照の解決を import 時に確定させる
+# （初回利用時の遅延構築コストを外す）
+Character.model_rebuild()
+
+
 # -----------------------------
 # export 制御
 # -----------------------------
@@ -21,7 +21,7 @@ Diff とは:
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -105,6 +105,18 @@ class Diff(BaseModel):
     # - 適用順序を表現してはいけない
     files: List[DiffFile] = Field(default_factory=list)
 
+    # LLM の生レスポンス全文
+    #
+    # - 厳密なパースが入るまでの「判断の原文」
+    # - ファイルごとに複製せず、Diff 全体で一度だけ保持する
+    #   （N ファイル分の重複シリアライズを防ぐ）
+    #
+    # 注意:
+    # - これは「参考情報」であり、適用対象ではない
+    # - パーサが DiffFile.after を埋められるようになったら
+    #   依存を減らしていく前提
+    raw_response: Optional[str] = None
+
     # --------------------------------------------------------
     # Pydantic 設定
     # --------------------------------------------------------
@@ -118,6 +130,15 @@ class Diff(BaseModel):
     }
 
 
+# ============================================================
+# スキーマ事前構築
+# ============================================================
+# 前方参照の解決を import 時に確定させる
+# （初回リクエストから遅延構築コストを外す）
+DiffFile.model_rebuild()
+Diff.model_rebuild()
+
+
 # ============================================================
 # export 制御
 # ============================================================
@@ -110,7 +110,9 @@ class Message(BaseModel):
         metadata を更新した新しい Message インスタンスを返す。
 
         frozen=True のため、既存インスタンスは変更せず、
-        常にコピーを生成する。
+        更新がある場合は新しいコピーを生成する。
+        更新が空の場合はコピーを作らず self をそのまま返す
+        （イミュータブルなので共有しても安全）。
 
         使用例:
             msg = Message(role="user", content="hello")
@@ -120,15 +122,29 @@ class Message(BaseModel):
         - ここで判断ロジックを入れてはいけない
         - metadata の内容解釈は上位層の責務
         """
-        base: Dict[str, Any] = dict(self.metadata or {})
-        base.update(updates)
+        # 更新なしならコピーを作らない（frozen なので共有して安全）
+        if not updates:
+            return self
+
+        # dict() + update() の 2 段階ではなく、
+        # DICT_MERGE 1 命令（C レベル）でマージする
+        # （後勝ちのキー上書き規則は従来どおり）
+        merged: Dict[str, Any] = {**(self.metadata or {}), **updates}
         return Message(
             role=self.role,
             content=self.content,
-            metadata=base,
+            metadata=merged,
         )
 
 
+# -----------------------------
+# スキーマ事前構築
+# -----------------------------
+# 前方参照の解決を import 時に確定させる
+# （初回利用時の遅延構築コストを外す）
+Message.model_rebuild()
+
+
 # -----------------------------
 # export 制御
 # -----------------------------
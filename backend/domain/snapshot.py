@@ -21,9 +21,10 @@ Backend は簡単に「ブラックボックス化」する。
 
 from __future__ import annotations
 
+import sys
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # -----------------------------
@@ -57,6 +58,18 @@ class SnapshotFile(BaseModel):
     # - 正規化や加工はこの層で行わない
     content: str = Field(min_length=0)
 
+    # -----------------------------
+    # 文字列の intern 化
+    # -----------------------------
+    #
+    # path は WorkspaceIndex / Diff と同じ文字列が往復するため、
+    # intern して同一内容を 1 オブジェクトに畳み込む
+    # （content は実質ユニークなので対象外）
+    @field_validator("path", mode="before")
+    @classmethod
+    def _intern_path(cls, v: object) -> object:
+        return sys.intern(v) if isinstance(v, str) else v
+
     # -----------------------------
     # Pydantic 設定
     # -----------------------------
@@ -109,6 +122,15 @@ class Snapshot(BaseModel):
     }
 
 
+# -----------------------------
+# スキーマ事前構築
+# -----------------------------
+# 前方参照の解決を import 時に確定させる
+# （初回リクエストから遅延構築コストを外す）
+SnapshotFile.model_rebuild()
+Snapshot.model_rebuild()
+
+
 # -----------------------------
 # export 制御
 # -----------------------------
@@ -22,9 +22,10 @@ Backend 全体の安全性・追跡性が崩壊するため、
 
 from __future__ import annotations
 
-from typing import List, Optional
+import sys
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # -----------------------------
@@ -74,18 +75,46 @@ class WorkspaceFile(BaseModel):
     #
     # - 静的解析結果
     # - Snapshot 範囲決定の補助情報
-    imports: List[str] = Field(default_factory=list)
+    #
+    # ※ モデル自体が frozen のため、生成後に伸びない
+    #   tuple で保持する（list の余剰キャパシティ分を節約）
+    imports: Tuple[str, ...] = Field(default_factory=tuple)
 
     # export しているシンボル・モジュール一覧
     #
     # - 依存関係の逆引き用
-    exports: List[str] = Field(default_factory=list)
+    exports: Tuple[str, ...] = Field(default_factory=tuple)
 
     # 依存しているファイルパス一覧
     #
     # - import 情報などを元に構築される
     # - Workspace 内部の関係性のみを扱う
-    dependencies: List[str] = Field(default_factory=list)
+    dependencies: Tuple[str, ...] = Field(default_factory=tuple)
+
+    # -----------------------------
+    # 文字列の intern 化
+    # -----------------------------
+    #
+    # language は少数の値（"typescript" 等）が全ファイルで
+    # 繰り返され、path は他ファイルの dependencies から
+    # 何度も参照される。sys.intern で同一内容を 1 オブジェクトに
+    # 畳み込み、メモリと比較コスト（ポインタ一致で短絡）を抑える。
+    #
+    # 注意: hash は実質ユニークなので intern しない
+    @field_validator("language", "path", mode="before")
+    @classmethod
+    def _intern_scalar(cls, v: object) -> object:
+        return sys.intern(v) if isinstance(v, str) else v
+
+    @field_validator("dependencies", mode="before")
+    @classmethod
+    def _intern_dependencies(cls, v: object) -> object:
+        if isinstance(v, (list, tuple)):
+            return tuple(
+                sys.intern(item) if isinstance(item, str) else item
+                for item in v
+            )
+        return v
 
     # -----------------------------
     # Pydantic 設定
@@ -156,6 +185,16 @@ class WorkspaceIndex(BaseModel):
     }
 
 
+# -----------------------------
+# スキーマ事前構築
+# -----------------------------
+# from __future__ import annotations 下の前方参照解決を
+# 初回インスタンス化時ではなく import 時に確定させる
+# （初回リクエストから遅延構築コストを外す）
+WorkspaceFile.model_rebuild()
+WorkspaceIndex.model_rebuild()
+
+
 # -----------------------------
 # export 制御
 # -----------------------------
@@ -23,13 +23,18 @@ domain / core / services を汚さないための
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
-
-from supabase import Client, create_client
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from backend.domain.workspace_index import WorkspaceIndex
 from backend.infra.logger import get_logger
 
+# supabase SDK はロードが重いため、実行時は
+# create_supabase_client() 内で初めて import する。
+# （型検査時のみモジュールトップで解決する）
+if TYPE_CHECKING:
+    from supabase import Client
+
 
 # ============================================================
 # Logger
@@ -51,16 +56,23 @@ SUPABASE_KEY_ENV = "SUPABASE_SERVICE_ROLE_KEY"
 # ============================================================
 # Supabase Client 生成
 # ============================================================
+@lru_cache(maxsize=1)
 def create_supabase_client() -> Client:
     """
     Supabase Client を生成する。
 
     注意:
     - Client はシングルトン的に使われる想定
-    - この関数内で再生成されてもよいが、
-      state（状態）を持たせてはいけない
+    - プロセス内では同一インスタンスを返す（lru_cache）。
+      再生成のたびに HTTP コネクションプール / TLS セッションを
+      作り直さないための保険（deps 側のシングルトンと二重でも害はない）
+    - 接続情報を変更した場合は cache_clear() するか
+      プロセスを再起動する
     """
 
+    # SDK 本体の import をここまで遅延する
+    from supabase import create_client
+
     url = os.getenv(SUPABASE_URL_ENV)
     key = os.getenv(SUPABASE_KEY_ENV)
 
@@ -77,6 +89,48 @@ def create_supabase_client() -> Client:
 # ============================================================
 # Workspace Index 永続化
 # ============================================================
+def save_workspace_indexes(
+    client: Client,
+    workspace_indexes: List[WorkspaceIndex],
+) -> None:
+    """
+    複数の Workspace Index を一括で Supabase に保存する。
+
+    保存方針:
+    - 1 件ずつ insert すると件数分の HTTP 往復が発生するため、
+      配列ペイロードの upsert 1 回にまとめる
+    - (project_id, index_version) 重複時は上書き
+
+    注意:
+    - Workspace Index の構造を改変してはいけない
+    - JSON 化は Pydantic に委ねる
+    """
+
+    if not workspace_indexes:
+        return
+
+    logger.info(
+        "Saving workspace indexes: count=%d",
+        len(workspace_indexes),
+    )
+
+    rows: List[Dict[str, Any]] = [
+        {
+            "project_id": wi.project_id,
+            "index_version": wi.index_version,
+            "index_data": wi.model_dump(),
+        }
+        for wi in workspace_indexes
+    ]
+
+    # テーブル名は Backend_Data_Models.md に準拠
+    (
+        client.table("workspace_indexes")
+        .upsert(rows, on_conflict="project_id,index_version")
+        .execute()
+    )
+
+
 def save_workspace_index(
     client: Client,
     workspace_index: WorkspaceIndex,
@@ -90,8 +144,7 @@ def save_workspace_index(
     - Update / Upsert の詳細は DB 側設計に委ねる
 
     注意:
-    - Workspace Index の構造を改変してはいけない
-    - JSON 化は Pydantic に委ねる
+    - 実体は一括保存（save_workspace_indexes）の 1 件版
     """
 
     logger.info(
@@ -100,14 +153,7 @@ def save_workspace_index(
         workspace_index.index_version,
     )
 
-    data: Dict[str, Any] = {
-        "project_id": workspace_index.project_id,
-        "index_version": workspace_index.index_version,
-        "index_data": workspace_index.model_dump(),
-    }
-
-    # テーブル名は Backend_Data_Models.md に準拠
-    client.table("workspace_indexes").insert(data).execute()
+    save_workspace_indexes(client, [workspace_index])
 
 
 def get_latest_workspace_index(
@@ -164,5 +210,6 @@ def get_latest_workspace_index(
 __all__ = [
     "create_supabase_client",
     "save_workspace_index",
+    "save_workspace_indexes",
     "get_latest_workspace_index",
 ]
@@ -0,0 +1,130 @@
+# backend/infra/ttl_cache.py
+"""
+TTLCache 定義
+
+このファイルは、ai-workbench Backend における
+「短寿命のメモリ内キャッシュ」を提供する infra 層の実装である。
+
+この層の役割:
+- キー → 値 の対応を一定時間（TTL）だけ保持する
+- 上限件数を超えたら古いものから捨てる
+- それ以上のことは一切しない
+
+やってはいけないこと:
+- キャッシュ対象の意味解釈
+- キー生成ロジックの実装（呼び出し側の責務）
+- 永続化・外部ストレージ連携
+- 「なければ作る」系の判断
+
+TTLCache は
+「忘れっぽい辞書」であり、
+「賢い記憶装置」ではない。
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+from backend.infra.logger import get_logger
+
+
+# ============================================================
+# Logger
+# ============================================================
+logger = get_logger(__name__)
+
+
+T = TypeVar("T")
+
+
+# ============================================================
+# TTLCache
+# ============================================================
+class TTLCache(Generic[T]):
+    """
+    TTL 付きメモリ内キャッシュ。
+
+    設計方針:
+    - スレッドセーフ性は CPython の dict 操作の原子性に依る
+      （取りこぼしても再計算されるだけで壊れない用途に限る）
+    - 期限切れ判定は取得時に行う（バックグラウンド掃除なし）
+    - 上限超過時は挿入順の古いものから捨てる
+
+    注意:
+    - 「正しさ」をキャッシュに依存させてはいけない
+    - キャッシュミスが害にならない処理にのみ使うこと
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60.0) -> None:
+        """
+        TTLCache を初期化する。
+
+        引数:
+        - maxsize : 保持する最大件数
+        - ttl     : 値の寿命（秒）
+        """
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+        # key -> (期限時刻, 値)
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        キャッシュ済みの値を取得する。
+
+        戻り値:
+        - 有効期限内の値、または None（未登録・期限切れ）
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if time.monotonic() >= expires_at:
+            # 期限切れはその場で破棄する
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        """
+        値をキャッシュに登録する。
+
+        注意:
+        - 同一キーは上書きする
+        - 上限超過時は最も古いエントリを捨てる
+        """
+
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+# ============================================================
+# 使用上の注意（設計固定）
+# ============================================================
+#
+# - TTLCache にキー生成ロジックを足さない
+# - 「キャッシュがないと動かない」設計にしない
+# - 永続化したくなったら、それは別の責務（DB 層）
+#
+# TTLCache は
+# 「同じ質問を短時間に繰り返された時の近道」であり、
+# 「真実の保管場所」ではない。
+#
+
+__all__ = [
+    "TTLCache",
+]
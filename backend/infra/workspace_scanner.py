@@ -28,8 +28,10 @@ from __future__ import annotations
 
 import os
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Tuple
 
 from backend.domain.workspace_index import (
     WorkspaceIndex,
@@ -56,19 +58,114 @@ logger = get_logger(__name__)
 #
 
 # Python / JavaScript 系で「読む意味がない or 危険」なディレクトリ
-IGNORE_DIRS = {
+#
+# frozenset はハッシュ済み定数としてメンバーシップ判定が O(1) で、
+# 誤って変更されることもない
+IGNORE_DIRS = frozenset({
     ".git",
     "__pycache__",
     ".venv",
     ".next",
     "node_modules",
-}
+})
 
-# 読み取る必要がない・ロックされがちな拡張子
-IGNORE_EXTENSIONS = {
+# 読み取る必要がない・ロックされがちな拡張子（小文字・ドット付き）
+IGNORE_EXTENSIONS = frozenset({
     ".pyc",
     ".lock",
-}
+})
+
+# imports / exports / dependencies の初期値として共有する空タプル
+# （scan 直後は常に空。ファイルごとに作り直さない）
+_EMPTY: Tuple[str, ...] = ()
+
+
+# ============================================================
+# ハッシュキャッシュ
+# ============================================================
+#
+# 再スキャンでは大半のファイルが未変更のため、
+# (絶対パス, mtime_ns, size) をキーに digest をキャッシュする。
+# 変更されたファイルはキーが変わり自然に無効化されるので、
+# クリーンなツリーの再スキャンは stat 走査だけで済む。
+#
+# maxsize は環境変数で調整可能（デフォルト 8192 エントリ、
+# infra/file_loader.py の読み込みキャッシュと同じ方式）
+SCANNER_HASH_CACHE_SIZE_ENV = "SCANNER_HASH_CACHE_SIZE"
+
+_HASH_CACHE_MAXSIZE = int(os.environ.get(SCANNER_HASH_CACHE_SIZE_ENV, "8192"))
+
+# posix_fadvise は POSIX 環境（Linux 等）のみ提供される。
+# Windows では存在しないため hasattr で分岐を固定しておく。
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+@lru_cache(maxsize=_HASH_CACHE_MAXSIZE)
+def _cached_digest(abs_path: str, mtime_ns: int, size: int) -> str:
+    """
+    内容が (mtime_ns, size) で識別されるファイルの SHA-256 を返す。
+
+    注意:
+    - mtime_ns / size はキャッシュキーとしてのみ意味を持つ
+    - hashlib.file_digest（3.11+）が C レベルで
+      読み取り→digest を一括処理する
+      （8KiB チャンクの Python ループより速く、
+        大きなファイルでもメモリは一定）
+    """
+    with open(abs_path, "rb") as f:
+        # 先頭から末尾まで一気読みすることをカーネルに伝え、
+        # readahead を深くしてもらう（非対応 OS では何もしない）
+        if _HAS_FADVISE:
+            os.posix_fadvise(
+                f.fileno(),
+                0,
+                0,
+                os.POSIX_FADV_SEQUENTIAL | os.POSIX_FADV_WILLNEED,
+            )
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# ============================================================
+# ディレクトリ走査
+# ============================================================
+def _walk_entries(root: str) -> Iterator[os.DirEntry]:
+    """
+    root 以下の通常ファイルを DirEntry のまま列挙する。
+
+    os.walk を使わない理由:
+    - os.walk は名前のリストを組み立てるだけで、
+      種別判定やパス結合・stat は呼び出し側に残る
+    - os.scandir の DirEntry は種別・stat 情報を
+      キャッシュしており、余計なシステムコールが出ない
+    - entry.path がそのまま使えるので join も不要
+
+    注意:
+    - 除外ディレクトリは再帰そのものを止める
+      （.git / node_modules を無限に舐めない）
+    - ディレクトリの symlink は辿らない（ループ防止）。
+      ファイルの symlink は通常ファイルとして列挙する
+      （os.walk が filenames に含めていたのと同じ挙動）
+    - 読めないディレクトリ（権限不足・走査中の削除など）は
+      ログ出力してスキップする（os.walk 時代と同じ挙動）
+    """
+    try:
+        it = os.scandir(root)
+    except OSError as e:
+        logger.info(
+            "Skipped unreadable directory: %s (%s)",
+            root,
+            e.__class__.__name__,
+        )
+        return
+
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in IGNORE_DIRS:
+                    continue
+                yield from _walk_entries(entry.path)
+            elif entry.is_file():
+                yield entry
 
 
 # ============================================================
@@ -112,37 +209,72 @@ class WorkspaceScanner:
         if not os.path.isdir(root_path):
             raise RuntimeError(f"root_path is not a directory: {root_path}")
 
-        files: List[WorkspaceFile] = []
-
         # ----------------------------------------------------
-        # os.walk による再帰走査
+        # os.scandir ベースの再帰走査（対象ファイルの列挙のみ）
         #
-        # 注意:
-        # - dirnames を in-place で書き換えることで
-        #   以降の再帰そのものを止める
-        # - これをやらないと .git / node_modules を
-        #   無限に舐めることになる
+        # DirEntry の stat 情報はここで取り切り、
+        # ハッシュ計算側では stat を繰り返さない
         # ----------------------------------------------------
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            # 除外ディレクトリをその場で削除
-            dirnames[:] = [
-                d for d in dirnames
-                if d not in IGNORE_DIRS
-            ]
+        entries: List[Tuple[str, str, os.stat_result]] = []
+
+        for entry in _walk_entries(root_path):
+            filename = entry.name
+
+            # 拡張子ベースの除外
+            #
+            # - relpath などの文字列処理より前に弾く
+            # - splitext はタプル生成 + 余計な分解を伴うため、
+            #   rfind による末尾スライスで判定する
+            #   （dot > 0 の条件は ".lock" のような
+            #     ドット始まりファイル名を拡張子扱いしない
+            #     splitext と同じ挙動）
+            dot = filename.rfind(".")
+            if dot > 0 and filename[dot:].lower() in IGNORE_EXTENSIONS:
+                continue
+
+            # DirEntry が保持する stat をそのまま使う
+            # （キャッシュ済みなら追加のシステムコールなし。
+            #   symlink は辿り、ハッシュ対象＝リンク先の
+            #   mtime/size をキャッシュキーにする）
+            try:
+                st = entry.stat()
+            except OSError as e:
+                logger.info(
+                    "Skipped unreadable file: %s (%s)",
+                    entry.path,
+                    e.__class__.__name__,
+                )
+                continue
 
-            for filename in filenames:
-                # 拡張子ベースの除外
-                _, ext = os.path.splitext(filename)
-                if ext in IGNORE_EXTENSIONS:
-                    continue
+            # ルートからの相対パスに正規化
+            rel_path = os.path.relpath(entry.path, root_path)
 
-                full_path = os.path.join(dirpath, filename)
+            entries.append((entry.path, rel_path, st))
 
-                # ルートからの相対パスに正規化
-                rel_path = os.path.relpath(full_path, root_path)
+        # ----------------------------------------------------
+        # ハッシュ計算（スレッドで I/O を重ねる）
+        #
+        # - ハッシュはディスク読み取り待ちが支配的で、
+        #   read() 中は GIL が解放されるため並列化が効く
+        # - submit 順に結果を回収するので出力順は走査順のまま
+        # - 読めないファイルのスキップ判定は従来どおり
+        #   ファイル単位で行う
+        # ----------------------------------------------------
+        rel_paths: List[str] = []
+        hashes: List[str] = []
+
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _cached_digest, full_path, st.st_mtime_ns, st.st_size
+                )
+                for full_path, _, st in entries
+            ]
 
+            for (full_path, rel_path, _), future in zip(entries, futures):
                 try:
-                    file_hash = self._calculate_file_hash(full_path)
+                    file_hash = future.result()
                 except (PermissionError, OSError) as e:
                     # 読めないファイルは想定内
                     # （lock / 権限 / 使用中など）
@@ -153,17 +285,28 @@ class WorkspaceScanner:
                     )
                     continue
 
-                # scan フェーズでは意味情報は一切扱わない
-                files.append(
-                    WorkspaceFile(
-                        path=rel_path.replace(os.sep, "/"),
-                        language=None,
-                        hash=file_hash,
-                        imports=[],
-                        exports=[],
-                        dependencies=[],
-                    )
-                )
+                rel_paths.append(rel_path.replace(os.sep, "/"))
+                hashes.append(file_hash)
+
+        # ----------------------------------------------------
+        # WorkspaceFile の一括構築
+        #
+        # - path / hash はここで生成したばかりの正当な値なので、
+        #   Pydantic バリデーションを通し直す意味がない
+        #   （model_construct で 1 件ごとの検証コストを省く）
+        # - scan フェーズでは意味情報は一切扱わない
+        # ----------------------------------------------------
+        files: List[WorkspaceFile] = [
+            WorkspaceFile.model_construct(
+                path=rel_path,
+                language=None,
+                hash=file_hash,
+                imports=_EMPTY,
+                exports=_EMPTY,
+                dependencies=_EMPTY,
+            )
+            for rel_path, file_hash in zip(rel_paths, hashes)
+        ]
 
         workspace = WorkspaceIndex(
             project_id=project_id,
@@ -180,26 +323,6 @@ class WorkspaceScanner:
 
         return workspace
 
-    # --------------------------------------------------------
-    # 内部ユーティリティ
-    # --------------------------------------------------------
-    def _calculate_file_hash(self, file_path: str) -> str:
-        """
-        ファイル内容から SHA-256 ハッシュを計算する。
-
-        注意:
-        - バイナリとして読み取る
-        - 大きなファイルにも対応できるよう chunk 単位で読む
-        """
-
-        sha256 = hashlib.sha256()
-
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-
-        return sha256.hexdigest()
-
 
 __all__ = [
     "WorkspaceScanner",
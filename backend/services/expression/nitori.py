@@ -23,6 +23,21 @@ from typing import Any
 from backend.services.expression.base import ExpressionBase
 
 
+# ============================================================
+# 表現定数（呼び出しごとに再構築しない）
+# ============================================================
+
+# 前置き（軽い導入）
+_PREFIX = "ちょっと見てみたけど、"
+
+# 語尾（断定を避ける）
+_SUFFIX = "…って感じかな。"
+
+# 「既に文が閉じている」とみなす終端文字
+# （いずれも 1 文字なので末尾 1 文字の集合判定で足りる）
+_END_CHARS = frozenset("。！?？")
+
+
 class NitoriExpression(ExpressionBase):
     """
     河城にとり用 Expression クラス。
@@ -77,21 +92,17 @@ class NitoriExpression(ExpressionBase):
             # 空文字はそのまま返す（無理に喋らせない）
             return text
 
-        # --- 前置き（軽い導入） ---
-        prefix = "ちょっと見てみたけど、"
-
-        # --- 語尾（断定を避ける） ---
-        suffix = "…って感じかな。"
-
         # すでに改行が多い場合は、前置きを控えめにする
         if "\n" in text:
-            formatted = f"{prefix}\n{text}"
+            formatted = _PREFIX + "\n" + text
         else:
-            formatted = f"{prefix}{text}"
+            formatted = _PREFIX + text
 
         # 強い断定を避けるため、最後に柔らかい語尾を付ける
-        if not formatted.endswith(("。", "！", "?", "？")):
-            formatted = f"{formatted}{suffix}"
+        # （終端文字はすべて 1 文字なので、endswith のタプル走査
+        #   ではなく末尾 1 文字の frozenset 判定で済ませる）
+        if formatted[-1] not in _END_CHARS:
+            formatted += _SUFFIX
 
         return formatted
 
@@ -33,16 +33,17 @@ class ExpressionRegistry:
     Expression 登録管理クラス。
 
     設計方針:
-    - expression_id -> Expression クラス のみを管理
-    - インスタンス生成もここで行う
+    - expression_id -> Expression インスタンス のみを管理
+    - インスタンス生成は register 時の一度だけ行う
+      （Expression はステートレス前提のため flyweight で使い回す）
     - グローバルな if 分岐は禁止
     """
 
     def __init__(self) -> None:
-        # 登録済み Expression クラスの辞書
+        # 登録済み Expression インスタンスの辞書
         # key: expression_id
-        # value: Expression クラス
-        self._registry: Dict[str, Type[ExpressionBase]] = {}
+        # value: Expression インスタンス（共有・使い回し）
+        self._registry: Dict[str, ExpressionBase] = {}
 
     # ============================================================
     # 登録処理
@@ -57,7 +58,8 @@ class ExpressionRegistry:
 
         注意:
         - expression_id の重複はエラーとする
-        - インスタンスではなく「クラス」を登録する
+        - ID 取得用に生成したインスタンスをそのまま登録する
+          （取得のたびに再生成しない）
         """
 
         # ExpressionBase を継承しているか最低限チェック
@@ -66,7 +68,7 @@ class ExpressionRegistry:
                 "expression_cls must be subclass of ExpressionBase"
             )
 
-        # 一度インスタンス化して ID を取得する
+        # ID 取得のために生成するインスタンスが、そのまま共有実体になる
         instance = expression_cls()
         expression_id = instance.expression_id
 
@@ -75,7 +77,7 @@ class ExpressionRegistry:
                 f"Expression already registered: {expression_id}"
             )
 
-        self._registry[expression_id] = expression_cls
+        self._registry[expression_id] = instance
 
     # ============================================================
     # 取得処理
@@ -89,19 +91,17 @@ class ExpressionRegistry:
 
         注意:
         - 未登録の場合は KeyError を投げる
+        - Expression は状態を持たない前提のため、
+          毎回生成せず register 時のインスタンスを共有で返す
         """
 
         try:
-            expression_cls = self._registry[expression_id]
+            return self._registry[expression_id]
         except KeyError as e:
             raise KeyError(
                 f"Expression not found: {expression_id}"
             ) from e
 
-        # Expression は状態を持たない前提のため、
-        # 取得時に毎回新しいインスタンスを生成する
-        return expression_cls()
-
     # ============================================================
     # 補助メソッド
     # ============================================================
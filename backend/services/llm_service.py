@@ -25,12 +25,16 @@ LLM Service 定義
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from backend.infra.logger import get_logger
 
+# OpenAI SDK はロードが重いため、実行時は
+# LLMService 初期化時に初めて import する。
+# （型検査時のみモジュールトップで解決する）
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 # ============================================================
 # Logger
@@ -84,7 +88,13 @@ class LLMService:
         """
 
         # 外部依存はここで閉じる
-        self._client = client or OpenAI()
+        # （SDK の import はこの時点まで遅延する）
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI()
+
+        self._client = client
 
         self._model = model
         self._temperature = temperature
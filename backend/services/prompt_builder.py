@@ -24,6 +24,7 @@ Prompt Builder は
 
 from __future__ import annotations
 
+import logging
 from typing import Optional
 
 from backend.domain.snapshot import Snapshot
@@ -37,6 +38,38 @@ from backend.infra.logger import get_logger
 logger = get_logger(__name__)
 
 
+# ============================================================
+# 固定プロンプト定数
+# ============================================================
+#
+# system プロンプトは完全に静的な文字列のため、
+# 呼び出しごとに組み立てず import 時に 1 度だけ確定させる。
+# （隣接リテラルの連結はコンパイル時に畳み込まれる）
+#
+# 静的な先頭部分が毎回バイト単位で一致していることは、
+# プロバイダ側のプロンプトキャッシュのヒット条件でもある。
+_SYSTEM_PROMPT = (
+    "You are an assistant that helps with software development tasks.\n"
+    "Follow the given instructions carefully and respond accurately.\n"
+    "Do not make assumptions beyond the provided information."
+)
+
+# user プロンプトの静的な骨組み。
+#
+# プロバイダ側のプロンプトキャッシュは「先頭からの一致」しか
+# 効かないため、不変の指示文はすべて先頭にまとめ、
+# 可変部（ファイル内容・Diff）はその後ろに置く。
+# 指示を末尾に残すと、可変部の後ろで毎回トークンを払い直す。
+_USER_PROMPT_PREFIX = (
+    "Based on the context below, perform the requested task.\n"
+    "\n"
+    "The following files are provided as context:\n"
+)
+
+# 既存 Diff を提示する際の見出し（これも不変）
+_DIFF_HEADER = "An existing proposed diff is shown below:\n"
+
+
 # ============================================================
 # Prompt Builder
 # ============================================================
@@ -71,13 +104,9 @@ class PromptBuilder:
         - JSON 形式強制などはここで行わない
         """
 
-        logger.debug("Building system prompt")
-
-        return (
-            "You are an assistant that helps with software development tasks.\n"
-            "Follow the given instructions carefully and respond accurately.\n"
-            "Do not make assumptions beyond the provided information."
-        )
+        # 完全に静的なため、定数をそのまま返す
+        # （可変情報のない debug ログもここでは出さない）
+        return _SYSTEM_PROMPT
 
     # --------------------------------------------------------
     # User Prompt
@@ -102,46 +131,78 @@ class PromptBuilder:
         - Diff の有無による「判断」は行わない
         """
 
-        logger.debug(
-            "Building user prompt: project_id=%s files=%d",
-            snapshot.project_id,
-            len(snapshot.files),
-        )
+        # DEBUG が無効なら len() も LogRecord 生成も払わない
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Building user prompt: project_id=%s files=%d",
+                snapshot.project_id,
+                len(snapshot.files),
+            )
 
-        lines: list[str] = []
+        # Diff の有無で専用メソッドに一度だけ振り分ける
+        # （各メソッドは自分のケースのコードだけを持つ）
+        if diff is None:
+            return self._build_user_prompt_no_diff(snapshot)
 
-        # ----------------------------------------------------
-        # Snapshot 情報
-        # ----------------------------------------------------
-        lines.append("The following files are provided as context:\n")
+        return self._build_user_prompt_with_diff(snapshot, diff)
 
-        for file in snapshot.files:
-            lines.append(f"--- FILE: {file.path} ---")
-            lines.append(file.content)
-            lines.append(f"--- END FILE: {file.path} ---\n")
+    # --------------------------------------------------------
+    # 内部: ケース別の組み立て
+    # --------------------------------------------------------
+    def _build_snapshot_blocks(self, snapshot: Snapshot) -> list[str]:
+        """
+        静的プレフィックス + Snapshot 部のブロック列を作る。
+
+        ファイルごとに複数要素を append するのではなく、
+        1 ファイル = 1 ブロックの f-string にまとめる。
+        join が走査するリストが短くなり、
+        ループ本体のバイトコードも 1 文になる。
+        """
+
+        blocks: list[str] = [_USER_PROMPT_PREFIX]
+
+        # path はブロック内で 2 回使うため、属性アクセスを
+        # 代入式で 1 回に抑える（content 等は 1 回なのでそのまま）
+        blocks += [
+            f"--- FILE: {(path := file.path)} ---\n"
+            f"{file.content}\n"
+            f"--- END FILE: {path} ---\n"
+            for file in snapshot.files
+        ]
+
+        return blocks
+
+    def _build_user_prompt_no_diff(self, snapshot: Snapshot) -> str:
+        """
+        Diff なし（新規生成）のプロンプトを組み立てる。
+        """
+
+        return "\n".join(self._build_snapshot_blocks(snapshot))
+
+    def _build_user_prompt_with_diff(
+        self,
+        snapshot: Snapshot,
+        diff: Diff,
+    ) -> str:
+        """
+        既存 Diff あり（再生成・修正）のプロンプトを組み立てる。
+        """
 
-        # ----------------------------------------------------
-        # 既存 Diff がある場合（再生成・修正用）
-        # ----------------------------------------------------
-        if diff:
-            lines.append("An existing proposed diff is shown below:\n")
+        blocks = self._build_snapshot_blocks(snapshot)
 
-            for diff_file in diff.files:
-                lines.append(f"--- DIFF TARGET: {diff_file.path} ---")
-                lines.append("<<< BEFORE >>>")
-                lines.append(diff_file.before)
-                lines.append("<<< AFTER >>>")
-                lines.append(diff_file.after)
-                lines.append(f"--- END DIFF: {diff_file.path} ---\n")
+        blocks.append(_DIFF_HEADER)
 
-        # ----------------------------------------------------
-        # 最終指示
-        # ----------------------------------------------------
-        lines.append(
-            "Based on the context above, perform the requested task."
-        )
+        blocks += [
+            f"--- DIFF TARGET: {(path := diff_file.path)} ---\n"
+            f"<<< BEFORE >>>\n"
+            f"{diff_file.before}\n"
+            f"<<< AFTER >>>\n"
+            f"{diff_file.after}\n"
+            f"--- END DIFF: {path} ---\n"
+            for diff_file in diff.files
+        ]
 
-        return "\n".join(lines)
+        return "\n".join(blocks)
 
 
 # ============================================================
@@ -151,6 +212,9 @@ class PromptBuilder:
 # - Prompt Builder は services 層専用
 # - LLMService と統合してはいけない
 # - プロンプトの内容に「判断結果」を混ぜない
+# - 組み立ては「list に貯めて最後に join 1 回」を崩さない
+#   （ループ内の `prompt += ...` はプロジェクト規模に対して
+#     O(n^2) になるため禁止。ブロックは必ず blocks に追加する）
 #
 # Prompt Builder は
 # 「聞き方を整える係」であり、